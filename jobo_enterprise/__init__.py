@@ -1,83 +1,118 @@
 """Official Python client for the Jobo Enterprise API."""
 
-from jobo_enterprise.client import JoboClient, AsyncJoboClient
-from jobo_enterprise.feed import JobsFeedClient, AsyncJobsFeedClient
-from jobo_enterprise.search import JobsSearchClient, AsyncJobsSearchClient
-from jobo_enterprise.locations import LocationsClient, AsyncLocationsClient
-from jobo_enterprise.auto_apply import AutoApplyClient, AsyncAutoApplyClient
-from jobo_enterprise.models import (
-    # Jobs
-    Job,
-    JobCompany,
-    JobLocation,
-    JobCompensation,
-    LocationFilter,
-    JobFeedRequest,
-    JobFeedResponse,
-    ExpiredJobIdsResponse,
-    JobSearchRequest,
-    JobSearchResponse,
-    # Geocoding
-    GeocodeResultItem,
-    GeocodedLocation,
-    # AutoApply
-    AutoApplySessionResponse,
-    FieldAnswer,
-    FieldAnswerFile,
-    FormFieldInfo,
-    FieldOption,
-    FieldValidations,
-    ValidationError,
-)
-from jobo_enterprise.exceptions import (
-    JoboError,
-    JoboAuthenticationError,
-    JoboRateLimitError,
-    JoboValidationError,
-    JoboServerError,
-)
+from typing import TYPE_CHECKING, List
+
+if TYPE_CHECKING:
+    # Redundant aliases mark these as intentional re-exports (the runtime
+    # equivalents are served lazily via __getattr__ below).
+    from jobo_enterprise.client import JoboClient as JoboClient, AsyncJoboClient as AsyncJoboClient
+    from jobo_enterprise.feed import JobsFeedClient as JobsFeedClient, AsyncJobsFeedClient as AsyncJobsFeedClient
+    from jobo_enterprise.search import (
+        JobsSearchClient as JobsSearchClient,
+        AsyncJobsSearchClient as AsyncJobsSearchClient,
+    )
+    from jobo_enterprise.locations import (
+        LocationsClient as LocationsClient,
+        AsyncLocationsClient as AsyncLocationsClient,
+    )
+    from jobo_enterprise.auto_apply import (
+        AutoApplyClient as AutoApplyClient,
+        AsyncAutoApplyClient as AsyncAutoApplyClient,
+    )
+    from jobo_enterprise.models import (
+        # Jobs
+        Job as Job,
+        JobCompany as JobCompany,
+        JobLocation as JobLocation,
+        JobCompensation as JobCompensation,
+        LocationFilter as LocationFilter,
+        JobFeedRequest as JobFeedRequest,
+        JobFeedResponse as JobFeedResponse,
+        ExpiredJobIdsResponse as ExpiredJobIdsResponse,
+        JobSearchRequest as JobSearchRequest,
+        JobSearchResponse as JobSearchResponse,
+        # Geocoding
+        GeocodeResultItem as GeocodeResultItem,
+        GeocodedLocation as GeocodedLocation,
+        # AutoApply
+        AutoApplySessionResponse as AutoApplySessionResponse,
+        FieldAnswer as FieldAnswer,
+        FieldAnswerFile as FieldAnswerFile,
+        FormFieldInfo as FormFieldInfo,
+        FieldOption as FieldOption,
+        FieldValidations as FieldValidations,
+        ValidationError as ValidationError,
+    )
+    from jobo_enterprise.exceptions import (
+        JoboError as JoboError,
+        JoboAuthenticationError as JoboAuthenticationError,
+        JoboRateLimitError as JoboRateLimitError,
+        JoboValidationError as JoboValidationError,
+        JoboServerError as JoboServerError,
+    )
+
 
 __version__ = "2.0.0"
 
-__all__ = [
+# Maps each public name to its defining submodule so that
+# ``import jobo_enterprise`` stays cheap: submodules (and the httpx/pydantic
+# machinery behind them) are only imported on first attribute access (PEP 562).
+_EXPORTS = {
     # Main clients
-    "JoboClient",
-    "AsyncJoboClient",
+    "JoboClient": "client",
+    "AsyncJoboClient": "client",
     # Sub-clients
-    "JobsFeedClient",
-    "AsyncJobsFeedClient",
-    "JobsSearchClient",
-    "AsyncJobsSearchClient",
-    "LocationsClient",
-    "AsyncLocationsClient",
-    "AutoApplyClient",
-    "AsyncAutoApplyClient",
+    "JobsFeedClient": "feed",
+    "AsyncJobsFeedClient": "feed",
+    "JobsSearchClient": "search",
+    "AsyncJobsSearchClient": "search",
+    "LocationsClient": "locations",
+    "AsyncLocationsClient": "locations",
+    "AutoApplyClient": "auto_apply",
+    "AsyncAutoApplyClient": "auto_apply",
     # Job models
-    "Job",
-    "JobCompany",
-    "JobLocation",
-    "JobCompensation",
-    "LocationFilter",
-    "JobFeedRequest",
-    "JobFeedResponse",
-    "ExpiredJobIdsResponse",
-    "JobSearchRequest",
-    "JobSearchResponse",
+    "Job": "models",
+    "JobCompany": "models",
+    "JobLocation": "models",
+    "JobCompensation": "models",
+    "LocationFilter": "models",
+    "JobFeedRequest": "models",
+    "JobFeedResponse": "models",
+    "ExpiredJobIdsResponse": "models",
+    "JobSearchRequest": "models",
+    "JobSearchResponse": "models",
     # Geocoding models
-    "GeocodeResultItem",
-    "GeocodedLocation",
+    "GeocodeResultItem": "models",
+    "GeocodedLocation": "models",
     # AutoApply models
-    "AutoApplySessionResponse",
-    "FieldAnswer",
-    "FieldAnswerFile",
-    "FormFieldInfo",
-    "FieldOption",
-    "FieldValidations",
-    "ValidationError",
+    "AutoApplySessionResponse": "models",
+    "FieldAnswer": "models",
+    "FieldAnswerFile": "models",
+    "FormFieldInfo": "models",
+    "FieldOption": "models",
+    "FieldValidations": "models",
+    "ValidationError": "models",
     # Exceptions
-    "JoboError",
-    "JoboAuthenticationError",
-    "JoboRateLimitError",
-    "JoboValidationError",
-    "JoboServerError",
-]
+    "JoboError": "exceptions",
+    "JoboAuthenticationError": "exceptions",
+    "JoboRateLimitError": "exceptions",
+    "JoboValidationError": "exceptions",
+    "JoboServerError": "exceptions",
+}
+
+__all__ = ["__version__", *_EXPORTS]
+
+
+def __getattr__(name: str) -> object:
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(f"jobo_enterprise.{submodule}"), name)
+    globals()[name] = value  # cache so subsequent lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(__all__)
@@ -0,0 +1,50 @@
+"""Bounded ETag response cache used by the opt-in ``cache_responses`` flag."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+_DEFAULT_MAXSIZE = 128
+
+V = TypeVar("V")
+
+
+class ResponseCache(Generic[V]):
+    """LRU of ``(etag, parsed_response)`` entries keyed by request identity.
+
+    Callers look up the stored ETag before a request to send
+    ``If-None-Match``, return the cached object on a 304, and store the
+    fresh object when a 200 carries an ``ETag`` header. Thread-safe, so
+    one cache can sit behind a sub-client used from several threads.
+
+    Cached values are handed back as-is, so every hit for a key shares
+    one object — callers must treat them as read-only.
+    """
+
+    def __init__(self, maxsize: int = _DEFAULT_MAXSIZE) -> None:
+        self._entries: "OrderedDict[Hashable, Tuple[str, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+
+    def lookup(self, key: Hashable) -> Optional[Tuple[str, V]]:
+        """Return the ``(etag, value)`` entry for ``key``, if cached."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def store(self, key: Hashable, etag: str, value: V) -> None:
+        """Remember ``value`` under ``key`` with its validator ``etag``."""
+        with self._lock:
+            self._entries[key] = (etag, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
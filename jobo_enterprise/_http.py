@@ -0,0 +1,35 @@
+"""Shared response-handling helpers used by the endpoint sub-clients."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, TypeVar
+
+from jobo_enterprise.exceptions import _handle_error
+
+if TYPE_CHECKING:
+    import httpx
+    from pydantic import TypeAdapter
+
+T = TypeVar("T")
+
+
+def _check(resp: "httpx.Response") -> None:
+    """Raise the mapped exception for error responses.
+
+    Anything >= 300 is an error: the clients never follow redirects, and
+    a 304 is only meaningful on the cache paths, which handle it before
+    calling this. The common 2xx case falls straight through.
+    """
+    if resp.status_code >= 300:
+        _handle_error(resp)
+
+
+def _decode(resp: "httpx.Response", adapter: "TypeAdapter[T]") -> T:
+    """Check ``resp`` for errors and validate its body with ``adapter``.
+
+    One call site-wide implementation of the check-then-validate tail that
+    every endpoint method otherwise repeats; validating from ``resp.content``
+    keeps the bytes-to-model path in pydantic-core.
+    """
+    _check(resp)
+    return adapter.validate_json(resp.content)
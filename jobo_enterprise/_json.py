@@ -0,0 +1,35 @@
+"""JSON encode/decode helpers that use orjson when it is installed.
+
+orjson is an optional dependency (``pip install jobo-enterprise[orjson]``);
+without it these helpers fall back to the stdlib ``json`` module.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the optional extra
+    orjson = None  # type: ignore[assignment]
+
+if orjson is not None:
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Decode JSON bytes/text into Python objects."""
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Encode a Python object as JSON bytes."""
+        return orjson.dumps(obj)
+
+else:
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Decode JSON bytes/text into Python objects."""
+        return json.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Encode a Python object as JSON bytes."""
+        return json.dumps(obj).encode("utf-8")
@@ -0,0 +1,78 @@
+"""Retrying httpx transports used by the default client configuration."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Optional
+
+import httpx
+
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+_BASE_BACKOFF = 0.5
+_MAX_BACKOFF = 8.0
+# Retry-After gets its own, larger cap: the server's hint is worth
+# honoring past the exponential ceiling, but never unboundedly — the
+# sleep runs inside the transport where no httpx timeout applies.
+_MAX_RETRY_AFTER = 60.0
+
+
+def _backoff(attempt: int, retry_after: Optional[str]) -> float:
+    """Seconds to wait before the given (0-indexed) retry attempt."""
+    if retry_after:
+        try:
+            return min(max(0.0, float(retry_after)), _MAX_RETRY_AFTER)
+        except ValueError:
+            pass
+    return min(_BASE_BACKOFF * (2.0**attempt), _MAX_BACKOFF)
+
+
+class RetryTransport(httpx.BaseTransport):
+    """Retries 429/5xx responses with exponential backoff.
+
+    Wraps another transport so retries reuse its connection pool — a
+    retried call stays on the existing (HTTP/2) connection instead of
+    paying a fresh handshake. ``Retry-After`` headers are honored.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, max_retries: int = 3) -> None:
+        self._transport = transport
+        self._max_retries = max_retries
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self._transport.handle_request(request)
+        for attempt in range(self._max_retries):
+            if response.status_code not in _RETRYABLE_STATUSES:
+                break
+            delay = _backoff(attempt, response.headers.get("Retry-After"))
+            response.read()
+            response.close()
+            time.sleep(delay)
+            response = self._transport.handle_request(request)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of :class:`RetryTransport`."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_retries: int = 3) -> None:
+        self._transport = transport
+        self._max_retries = max_retries
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self._transport.handle_async_request(request)
+        for attempt in range(self._max_retries):
+            if response.status_code not in _RETRYABLE_STATUSES:
+                break
+            delay = _backoff(attempt, response.headers.get("Retry-After"))
+            await response.aread()
+            await response.aclose()
+            await asyncio.sleep(delay)
+            response = await self._transport.handle_async_request(request)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
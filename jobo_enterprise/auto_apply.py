@@ -2,19 +2,31 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+import asyncio
+from typing import List, Sequence, Tuple
 from uuid import UUID
 
 import httpx
+from pydantic import TypeAdapter
 
+from jobo_enterprise import _json
+from jobo_enterprise._http import _decode
 from jobo_enterprise.exceptions import _handle_error
 from jobo_enterprise.models import (
     AutoApplySessionResponse,
     FieldAnswer,
-    StartAutoApplySessionRequest,
     SetAutoApplyAnswersRequest,
 )
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+_SESSIONS_PATH = "/api/auto-apply/sessions/"
+
+# Module-level adapters cache the compiled core schema + validator once,
+# avoiding per-call classmethod dispatch in the request/response hot path.
+_SESSION_ADAPTER = TypeAdapter(AutoApplySessionResponse)
+_SET_ANSWERS_ADAPTER = TypeAdapter(SetAutoApplyAnswersRequest)
+
 
 class AutoApplyClient:
     """Synchronous sub-client for the Auto Apply endpoints.
@@ -34,11 +46,10 @@ class AutoApplyClient:
         Returns:
             An :class:`AutoApplySessionResponse` with session details and form fields.
         """
-        request = StartAutoApplySessionRequest(apply_url=apply_url)
-        resp = self._client.post("/api/auto-apply/start", json=request.model_dump())
-        if resp.status_code != 200:
-            _handle_error(resp)
-        return AutoApplySessionResponse.model_validate(resp.json())
+        resp = self._client.post(
+            "/api/auto-apply/start", content=_json.dumps({"apply_url": apply_url}), headers=_JSON_HEADERS
+        )
+        return _decode(resp, _SESSION_ADAPTER)
 
     def set_answers(
         self,
@@ -54,11 +65,13 @@ class AutoApplyClient:
         Returns:
             An :class:`AutoApplySessionResponse` with updated session state.
         """
-        request = SetAutoApplyAnswersRequest(session_id=session_id, answers=answers)
-        resp = self._client.post("/api/auto-apply/set-answers", json=request.model_dump())
-        if resp.status_code != 200:
-            _handle_error(resp)
-        return AutoApplySessionResponse.model_validate(resp.json())
+        # Answers arrive as already-validated FieldAnswer instances, so skip
+        # re-running pydantic validation over the whole list.
+        request = SetAutoApplyAnswersRequest.model_construct(session_id=session_id, answers=answers)
+        resp = self._client.post(
+            "/api/auto-apply/set-answers", content=_SET_ANSWERS_ADAPTER.dump_json(request), headers=_JSON_HEADERS
+        )
+        return _decode(resp, _SESSION_ADAPTER)
 
     def end_session(self, session_id: UUID) -> bool:
         """End an auto-apply session.
@@ -69,10 +82,11 @@ class AutoApplyClient:
         Returns:
             True if the session was successfully ended, False if not found.
         """
-        resp = self._client.delete(f"/api/auto-apply/sessions/{session_id}")
-        if resp.status_code == 200:
+        resp = self._client.delete(_SESSIONS_PATH + str(session_id))
+        status = resp.status_code
+        if status == 200:
             return True
-        if resp.status_code == 404:
+        if status == 404:
             return False
         _handle_error(resp)
         return False
@@ -96,11 +110,10 @@ class AsyncAutoApplyClient:
         Returns:
             An :class:`AutoApplySessionResponse` with session details and form fields.
         """
-        request = StartAutoApplySessionRequest(apply_url=apply_url)
-        resp = await self._client.post("/api/auto-apply/start", json=request.model_dump())
-        if resp.status_code != 200:
-            _handle_error(resp)
-        return AutoApplySessionResponse.model_validate(resp.json())
+        resp = await self._client.post(
+            "/api/auto-apply/start", content=_json.dumps({"apply_url": apply_url}), headers=_JSON_HEADERS
+        )
+        return _decode(resp, _SESSION_ADAPTER)
 
     async def set_answers(
         self,
@@ -116,11 +129,40 @@ class AsyncAutoApplyClient:
         Returns:
             An :class:`AutoApplySessionResponse` with updated session state.
         """
-        request = SetAutoApplyAnswersRequest(session_id=session_id, answers=answers)
-        resp = await self._client.post("/api/auto-apply/set-answers", json=request.model_dump())
-        if resp.status_code != 200:
-            _handle_error(resp)
-        return AutoApplySessionResponse.model_validate(resp.json())
+        # Answers arrive as already-validated FieldAnswer instances, so skip
+        # re-running pydantic validation over the whole list.
+        request = SetAutoApplyAnswersRequest.model_construct(session_id=session_id, answers=answers)
+        resp = await self._client.post(
+            "/api/auto-apply/set-answers", content=_SET_ANSWERS_ADAPTER.dump_json(request), headers=_JSON_HEADERS
+        )
+        return _decode(resp, _SESSION_ADAPTER)
+
+    async def set_answers_many(
+        self,
+        batches: Sequence[Tuple[UUID, List[FieldAnswer]]],
+        *,
+        concurrency: int = 20,
+    ) -> List[AutoApplySessionResponse]:
+        """Set answers for several sessions concurrently.
+
+        Requests are issued in parallel (bounded by ``concurrency``) and
+        multiplex over the shared HTTP/2 connection.
+
+        Args:
+            batches: ``(session_id, answers)`` pairs, one per session.
+            concurrency: Maximum number of in-flight requests. Defaults to 20,
+                matching the client's keep-alive pool size.
+
+        Returns:
+            A list of :class:`AutoApplySessionResponse`, in input order.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _set(session_id: UUID, answers: List[FieldAnswer]) -> AutoApplySessionResponse:
+            async with semaphore:
+                return await self.set_answers(session_id, answers)
+
+        return list(await asyncio.gather(*(_set(sid, ans) for sid, ans in batches)))
 
     async def end_session(self, session_id: UUID) -> bool:
         """End an auto-apply session.
@@ -131,10 +173,11 @@ class AsyncAutoApplyClient:
         Returns:
             True if the session was successfully ended, False if not found.
         """
-        resp = await self._client.delete(f"/api/auto-apply/sessions/{session_id}")
-        if resp.status_code == 200:
+        resp = await self._client.delete(_SESSIONS_PATH + str(session_id))
+        status = resp.status_code
+        if status == 200:
             return True
-        if resp.status_code == 404:
+        if status == 404:
             return False
         _handle_error(resp)
         return False
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import threading
+import weakref
+from typing import Optional, Tuple
 
 import httpx
 
+from jobo_enterprise._transport import RetryTransport, AsyncRetryTransport
 from jobo_enterprise.feed import JobsFeedClient, AsyncJobsFeedClient
 from jobo_enterprise.search import JobsSearchClient, AsyncJobsSearchClient
 from jobo_enterprise.locations import LocationsClient, AsyncLocationsClient
@@ -13,7 +16,59 @@ from jobo_enterprise.auto_apply import AutoApplyClient, AsyncAutoApplyClient
 
 _DEFAULT_BASE_URL = "https://jobs-api.jobo.world"
 _DEFAULT_TIMEOUT = 30.0
+_DEFAULT_MAX_CONNECTIONS = 100
+_DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+_DEFAULT_KEEPALIVE_EXPIRY = 30.0
 _USER_AGENT = "jobo-python/2.0.0"
+_CONNECT_RETRIES = 2
+
+# Process-wide transport registry, keyed by pool configuration, so that
+# multiple JoboClient/AsyncJoboClient instances with the same settings reuse
+# one connection pool (and one HTTP/2 session) instead of each paying their
+# own TLS handshakes. Sharing happens below the client, so per-instance
+# headers (API keys) stay isolated while sockets are shared — in servers
+# that build a client per request/tenant, connection count stays O(1) per
+# host rather than O(clients).
+_PoolKey = Tuple[bool, int, int]
+_TRANSPORT_LOCK = threading.Lock()
+_SHARED_TRANSPORTS: dict[_PoolKey, httpx.HTTPTransport] = {}
+_SHARED_ASYNC_TRANSPORTS: dict[_PoolKey, httpx.AsyncHTTPTransport] = {}
+
+
+def _get_shared_transport(http2: bool, max_connections: int, max_keepalive_connections: int) -> httpx.HTTPTransport:
+    key = (http2, max_connections, max_keepalive_connections)
+    with _TRANSPORT_LOCK:
+        transport = _SHARED_TRANSPORTS.get(key)
+        if transport is None:
+            transport = _SHARED_TRANSPORTS[key] = httpx.HTTPTransport(
+                http2=http2,
+                retries=_CONNECT_RETRIES,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=_DEFAULT_KEEPALIVE_EXPIRY,
+                ),
+            )
+        return transport
+
+
+def _get_shared_async_transport(
+    http2: bool, max_connections: int, max_keepalive_connections: int
+) -> httpx.AsyncHTTPTransport:
+    key = (http2, max_connections, max_keepalive_connections)
+    with _TRANSPORT_LOCK:
+        transport = _SHARED_ASYNC_TRANSPORTS.get(key)
+        if transport is None:
+            transport = _SHARED_ASYNC_TRANSPORTS[key] = httpx.AsyncHTTPTransport(
+                http2=http2,
+                retries=_CONNECT_RETRIES,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=_DEFAULT_KEEPALIVE_EXPIRY,
+                ),
+            )
+        return transport
 
 
 class JoboClient:
@@ -30,7 +85,23 @@ class JoboClient:
         api_key: Your Jobo Enterprise API key.
         base_url: API base URL. Defaults to ``https://jobs-api.jobo.world``.
         timeout: Request timeout in seconds. Defaults to 30.
+        http2: Whether to negotiate HTTP/2, allowing concurrent requests to
+            multiplex over a single connection. Defaults to True.
+        max_connections: Maximum number of concurrent connections. Defaults to 100.
+        max_keepalive_connections: Number of idle connections kept alive for
+            reuse, amortizing TCP + TLS setup across requests. Defaults to 20.
+        shared_transport: Share one process-wide connection pool with other
+            clients using the same pool settings. Headers stay per-instance,
+            so different API keys can safely share sockets. Set to False
+            for a private pool. Defaults to True.
+        max_retries: Number of times 429/5xx responses are retried with
+            exponential backoff before surfacing. Defaults to 3; 0 disables.
+        cache_responses: Revalidate repeated feed/search requests with
+            If-None-Match and reuse the parsed response on a 304. Off by
+            default since staleness tolerance is application-dependent.
         httpx_client: Optional pre-configured ``httpx.Client`` instance.
+            Callers supplying their own client should mirror the defaults
+            above (HTTP/2, explicit pool limits) to keep pagination cheap.
     """
 
     def __init__(
@@ -39,24 +110,56 @@ class JoboClient:
         *,
         base_url: str = _DEFAULT_BASE_URL,
         timeout: float = _DEFAULT_TIMEOUT,
+        http2: bool = True,
+        max_connections: int = _DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = _DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        shared_transport: bool = True,
+        max_retries: int = 3,
+        cache_responses: bool = False,
         httpx_client: Optional[httpx.Client] = None,
     ) -> None:
         self._api_key = api_key
         self._base_url = base_url.rstrip("/")
-        self._client = httpx_client or httpx.Client(
-            base_url=self._base_url,
-            timeout=timeout,
-            headers={
+        self._shares_transport = False
+        # Prebuilt httpx.Headers: already normalized/encoded, so per-request
+        # header merging starts from the parsed form instead of a raw dict.
+        self._default_headers = httpx.Headers(
+            {
                 "X-Api-Key": api_key,
                 "User-Agent": _USER_AGENT,
                 "Accept": "application/json",
-            },
+            }
         )
+        if httpx_client is not None:
+            self._client = httpx_client
+        else:
+            transport: httpx.BaseTransport
+            if shared_transport:
+                transport = _get_shared_transport(http2, max_connections, max_keepalive_connections)
+                self._shares_transport = True
+            else:
+                transport = httpx.HTTPTransport(
+                    http2=http2,
+                    retries=_CONNECT_RETRIES,
+                    limits=httpx.Limits(
+                        max_connections=max_connections,
+                        max_keepalive_connections=max_keepalive_connections,
+                        keepalive_expiry=_DEFAULT_KEEPALIVE_EXPIRY,
+                    ),
+                )
+            if max_retries > 0:
+                transport = RetryTransport(transport, max_retries=max_retries)
+            self._client = httpx.Client(
+                base_url=self._base_url,
+                timeout=timeout,
+                transport=transport,
+                headers=self._default_headers,
+            )
 
-        self.feed = JobsFeedClient(self._client)
+        self.feed = JobsFeedClient(self._client, cache_responses=cache_responses)
         """Bulk job feed with cursor-based pagination."""
 
-        self.search = JobsSearchClient(self._client)
+        self.search = JobsSearchClient(self._client, cache_responses=cache_responses)
         """Full-text job search with filters and pagination."""
 
         self.locations = LocationsClient(self._client)
@@ -66,8 +169,13 @@ class JoboClient:
         """Automated job application form filling."""
 
     def close(self) -> None:
-        """Close the underlying HTTP client."""
-        self._client.close()
+        """Close the underlying HTTP client.
+
+        A no-op for clients on the shared process-wide transport, which is
+        left open for other instances.
+        """
+        if not self._shares_transport:
+            self._client.close()
 
     def __enter__(self) -> "JoboClient":
         return self
@@ -90,33 +198,101 @@ class AsyncJoboClient:
         api_key: Your Jobo Enterprise API key.
         base_url: API base URL. Defaults to ``https://jobs-api.jobo.world``.
         timeout: Request timeout in seconds. Defaults to 30.
+        http2: Whether to negotiate HTTP/2, allowing concurrent requests to
+            multiplex over a single connection. Defaults to True.
+        max_connections: Maximum number of concurrent connections. Defaults to 100.
+        max_keepalive_connections: Number of idle connections kept alive for
+            reuse, amortizing TCP + TLS setup across requests. Defaults to 20.
+        shared_transport: Share one process-wide connection pool with other
+            clients using the same pool settings. Headers stay per-instance,
+            so different API keys can safely share sockets. Set to False
+            for a private pool. Defaults to True.
+        max_retries: Number of times 429/5xx responses are retried with
+            exponential backoff before surfacing. Defaults to 3; 0 disables.
+        cache_responses: Revalidate repeated feed/search requests with
+            If-None-Match and reuse the parsed response on a 304. Off by
+            default since staleness tolerance is application-dependent.
         httpx_client: Optional pre-configured ``httpx.AsyncClient`` instance.
+            Callers supplying their own client should mirror the defaults
+            above (HTTP/2, explicit pool limits) to keep pagination cheap.
     """
 
+    _shared_instances: "weakref.WeakValueDictionary[Tuple[str, str], AsyncJoboClient]" = weakref.WeakValueDictionary()
+    _shared_instances_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, api_key: str, *, base_url: str = _DEFAULT_BASE_URL) -> "AsyncJoboClient":
+        """Return a memoized process-wide client for this API key.
+
+        Creating a fresh client per request throws away the connection
+        pool each time — reuse is where pooling pays off. This returns
+        one instance per ``(api_key, base_url)``, creating it on first
+        use, so per-request callers still share a pool transparently.
+        """
+        key = (api_key, base_url)
+        with cls._shared_instances_lock:
+            client = cls._shared_instances.get(key)
+            if client is None:
+                client = cls(api_key, base_url=base_url)
+                cls._shared_instances[key] = client
+            return client
+
     def __init__(
         self,
         api_key: str,
         *,
         base_url: str = _DEFAULT_BASE_URL,
         timeout: float = _DEFAULT_TIMEOUT,
+        http2: bool = True,
+        max_connections: int = _DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = _DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        shared_transport: bool = True,
+        max_retries: int = 3,
+        cache_responses: bool = False,
         httpx_client: Optional[httpx.AsyncClient] = None,
     ) -> None:
         self._api_key = api_key
         self._base_url = base_url.rstrip("/")
-        self._client = httpx_client or httpx.AsyncClient(
-            base_url=self._base_url,
-            timeout=timeout,
-            headers={
+        self._shares_transport = False
+        # Prebuilt httpx.Headers: already normalized/encoded, so per-request
+        # header merging starts from the parsed form instead of a raw dict.
+        self._default_headers = httpx.Headers(
+            {
                 "X-Api-Key": api_key,
                 "User-Agent": _USER_AGENT,
                 "Accept": "application/json",
-            },
+            }
         )
+        if httpx_client is not None:
+            self._client = httpx_client
+        else:
+            transport: httpx.AsyncBaseTransport
+            if shared_transport:
+                transport = _get_shared_async_transport(http2, max_connections, max_keepalive_connections)
+                self._shares_transport = True
+            else:
+                transport = httpx.AsyncHTTPTransport(
+                    http2=http2,
+                    retries=_CONNECT_RETRIES,
+                    limits=httpx.Limits(
+                        max_connections=max_connections,
+                        max_keepalive_connections=max_keepalive_connections,
+                        keepalive_expiry=_DEFAULT_KEEPALIVE_EXPIRY,
+                    ),
+                )
+            if max_retries > 0:
+                transport = AsyncRetryTransport(transport, max_retries=max_retries)
+            self._client = httpx.AsyncClient(
+                base_url=self._base_url,
+                timeout=timeout,
+                transport=transport,
+                headers=self._default_headers,
+            )
 
-        self.feed = AsyncJobsFeedClient(self._client)
+        self.feed = AsyncJobsFeedClient(self._client, cache_responses=cache_responses)
         """Bulk job feed with cursor-based pagination."""
 
-        self.search = AsyncJobsSearchClient(self._client)
+        self.search = AsyncJobsSearchClient(self._client, cache_responses=cache_responses)
         """Full-text job search with filters and pagination."""
 
         self.locations = AsyncLocationsClient(self._client)
@@ -126,8 +302,13 @@ class AsyncJoboClient:
         """Automated job application form filling."""
 
     async def close(self) -> None:
-        """Close the underlying HTTP client."""
-        await self._client.aclose()
+        """Close the underlying HTTP client.
+
+        A no-op for clients on the shared process-wide transport, which is
+        left open for other instances.
+        """
+        if not self._shares_transport:
+            await self._client.aclose()
 
     async def __aenter__(self) -> "AsyncJoboClient":
         return self
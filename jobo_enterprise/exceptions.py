@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Any, Optional, TYPE_CHECKING
 
+from jobo_enterprise import _json
+
 if TYPE_CHECKING:
     import httpx
 
@@ -49,19 +51,34 @@ class JoboServerError(JoboError):
     """Raised when the server returns a 5xx error."""
 
 
+# Status-code to exception table, checked before the generic class-based
+# fallback so dispatch is a single dict lookup rather than a compare chain.
+_STATUS_EXCEPTIONS = {
+    400: JoboValidationError,
+    401: JoboAuthenticationError,
+}
+
+
+# Server JSON errors are tiny; anything bigger is usually a gateway HTML
+# page, which we neither parse nor keep in full. Caps keep exception
+# construction cheap even for megabyte error bodies.
+_MAX_ERROR_BODY_BYTES = 4096
+_MAX_DETAIL_CHARS = 512
+
+
 def _handle_error(response: "httpx.Response") -> None:
     """Raise a typed exception based on the HTTP status code."""
     status = response.status_code
+    raw = response.content[:_MAX_ERROR_BODY_BYTES]
     try:
-        body = response.json()
+        body = _json.loads(raw)
     except Exception:
-        body = response.text
+        body = raw.decode("utf-8", errors="replace")
 
     detail = body.get("detail", "") if isinstance(body, dict) else str(body)
+    detail = detail[:_MAX_DETAIL_CHARS]
     message = f"HTTP {status}: {detail}" if detail else f"HTTP {status}"
 
-    if status == 401:
-        raise JoboAuthenticationError(message, status_code=status, detail=detail, response_body=body)
     if status == 429:
         retry_after = response.headers.get("Retry-After")
         raise JoboRateLimitError(
@@ -71,9 +88,5 @@ def _handle_error(response: "httpx.Response") -> None:
             response_body=body,
             retry_after=int(retry_after) if retry_after else None,
         )
-    if status == 400:
-        raise JoboValidationError(message, status_code=status, detail=detail, response_body=body)
-    if status >= 500:
-        raise JoboServerError(message, status_code=status, detail=detail, response_body=body)
-
-    raise JoboError(message, status_code=status, detail=detail, response_body=body)
+    exc_cls = _STATUS_EXCEPTIONS.get(status) or (JoboServerError if status >= 500 else JoboError)
+    raise exc_cls(message, status_code=status, detail=detail, response_body=body)
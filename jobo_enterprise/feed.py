@@ -2,21 +2,137 @@
 
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import AsyncIterator, Iterator, List, Optional, Union
-from uuid import UUID
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
 
 import httpx
+from pydantic import TypeAdapter
 
+from jobo_enterprise import _json
+from jobo_enterprise._cache import ResponseCache
+from jobo_enterprise._http import _check
 from jobo_enterprise.exceptions import _handle_error
 from jobo_enterprise.models import (
     Job,
-    JobFeedRequest,
     JobFeedResponse,
     ExpiredJobIdsResponse,
     LocationFilter,
 )
 
+try:
+    import ijson  # type: ignore[import-untyped]
+    from ijson.common import ObjectBuilder  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - depends on the optional extra
+    ijson = None
+    ObjectBuilder = None
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Module-level adapters amortize schema lookup once, then hot-loop through
+# the list — faster than validating through the envelope model, whose
+# scalar fields don't need Pydantic at all.
+_JOBS_ADAPTER: TypeAdapter[List[Job]] = TypeAdapter(List[Job])
+_JOB_IDS_ADAPTER: TypeAdapter[List[str]] = TypeAdapter(List[str])
+
+
+def _parse_feed_response(content: bytes) -> JobFeedResponse:
+    """Decode a feed page, fast-validating only the jobs array."""
+    data = _json.loads(content)
+    return JobFeedResponse.model_construct(
+        jobs=_JOBS_ADAPTER.validate_python(data.get("jobs", [])),
+        next_cursor=data.get("next_cursor"),
+        has_more=bool(data.get("has_more", False)),
+    )
+
+
+def _parse_expired_response(content: bytes) -> ExpiredJobIdsResponse:
+    """Decode an expired-IDs page, fast-validating only the ID array."""
+    data = _json.loads(content)
+    return ExpiredJobIdsResponse.model_construct(
+        job_ids=_JOB_IDS_ADAPTER.validate_python(data.get("job_ids", [])),
+        next_cursor=data.get("next_cursor"),
+        has_more=bool(data.get("has_more", False)),
+    )
+
+
+def _require_tz_aware(name: str, value: datetime) -> None:
+    """Reject naive datetimes up front instead of letting the server 400."""
+    if value.tzinfo is None:
+        raise ValueError(f"{name} must be timezone-aware, e.g. datetime.now(timezone.utc)")
+
+
+def _build_feed_body(
+    locations: Optional[List[LocationFilter]],
+    sources: Optional[List[str]],
+    is_remote: Optional[bool],
+    posted_after: Optional[datetime],
+    cursor: Optional[str],
+    batch_size: int,
+) -> Dict[str, Any]:
+    """Build a feed request body directly, bypassing :class:`JobFeedRequest`.
+
+    The feed schema is flat, so constructing and re-dumping a Pydantic
+    model per request buys nothing on this internal path — the public
+    request model remains for callers who want validation.
+    """
+    body: Dict[str, Any] = {"batch_size": batch_size}
+    if locations is not None:
+        body["locations"] = [location.model_dump(exclude_none=True) for location in locations]
+    if sources is not None:
+        body["sources"] = sources
+    if is_remote is not None:
+        body["is_remote"] = is_remote
+    if posted_after is not None:
+        _require_tz_aware("posted_after", posted_after)
+        body["posted_after"] = posted_after.isoformat()
+    if cursor is not None:
+        body["cursor"] = cursor
+    return body
+
+
+class _FeedPageParser:
+    """Incrementally parses one feed page from raw response bytes.
+
+    Feed chunks in via :meth:`push`; completed job dicts come back as soon
+    as their closing brace arrives, so jobs can be yielded while the rest
+    of the page is still on the wire. The page's ``next_cursor`` and
+    ``has_more`` scalars are captured as they appear.
+    """
+
+    def __init__(self) -> None:
+        self._events = ijson.sendable_list()
+        self._coro = ijson.parse_coro(self._events)
+        self._builder: Optional[ObjectBuilder] = None
+        self.next_cursor: Optional[str] = None
+        self.has_more = False
+
+    def push(self, chunk: bytes) -> List[Dict[str, Any]]:
+        self._coro.send(chunk)
+        return self._drain()
+
+    def finish(self) -> List[Dict[str, Any]]:
+        self._coro.close()
+        return self._drain()
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        jobs: List[Dict[str, Any]] = []
+        for prefix, event, value in self._events:
+            if prefix.startswith("jobs.item"):
+                if self._builder is None:
+                    self._builder = ObjectBuilder()
+                self._builder.event(event, value)
+                if prefix == "jobs.item" and event == "end_map":
+                    jobs.append(self._builder.value)
+                    self._builder = None
+            elif prefix == "next_cursor":
+                self.next_cursor = value
+            elif prefix == "has_more":
+                self.has_more = bool(value)
+        del self._events[:]
+        return jobs
+
 
 class JobsFeedClient:
     """Synchronous sub-client for the Jobs Feed endpoints.
@@ -24,8 +140,9 @@ class JobsFeedClient:
     Access via ``client.feed``.
     """
 
-    def __init__(self, http: httpx.Client) -> None:
+    def __init__(self, http: httpx.Client, cache_responses: bool = False) -> None:
         self._client = http
+        self._cache: Optional[ResponseCache[JobFeedResponse]] = ResponseCache() if cache_responses else None
 
     def get_jobs(
         self,
@@ -49,19 +166,26 @@ class JobsFeedClient:
 
         Returns:
             A :class:`JobFeedResponse` with jobs, cursor, and pagination flag.
+            With ``cache_responses`` enabled, a 304 returns the shared cached
+            object; treat it as read-only.
         """
-        request = JobFeedRequest(
-            locations=locations,
-            sources=sources,
-            is_remote=is_remote,
-            posted_after=posted_after,
-            cursor=cursor,
-            batch_size=batch_size,
-        )
-        resp = self._client.post("/api/feed/jobs", json=request.model_dump(exclude_none=True))
-        if resp.status_code != 200:
-            _handle_error(resp)
-        return JobFeedResponse.model_validate(resp.json())
+        body = _build_feed_body(locations, sources, is_remote, posted_after, cursor, batch_size)
+        content = _json.dumps(body)
+        headers = _JSON_HEADERS
+        cached = self._cache.lookup(content) if self._cache is not None else None
+        if cached is not None:
+            headers = dict(_JSON_HEADERS)
+            headers["If-None-Match"] = cached[0]
+        resp = self._client.post("/api/feed/jobs", content=content, headers=headers)
+        if cached is not None and resp.status_code == 304:
+            return cached[1]
+        _check(resp)
+        response = _parse_feed_response(resp.content)
+        if self._cache is not None:
+            etag = resp.headers.get("ETag")
+            if etag:
+                self._cache.store(content, etag, response)
+        return response
 
     def iter_jobs(
         self,
@@ -71,26 +195,116 @@ class JobsFeedClient:
         is_remote: Optional[bool] = None,
         posted_after: Optional[datetime] = None,
         batch_size: int = 1000,
+        resume_cursor: Optional[str] = None,
     ) -> Iterator[Job]:
         """Iterate over all jobs in the feed, automatically handling pagination.
 
+        While the caller is consuming a page, the next one is fetched on a
+        background thread, so network latency hides behind processing time.
+        At most one page is in flight. Only the current page's cursor is
+        held; pass a previously saved cursor as ``resume_cursor`` to
+        continue an interrupted crawl (see :meth:`iter_jobs_with_cursor`
+        for checkpointing).
+
         Yields:
             Individual :class:`Job` objects.
         """
-        cursor: Optional[str] = None
+        # Only the cursor changes between pages, so build the body once and
+        # reuse it for every page.
+        body = _build_feed_body(locations, sources, is_remote, posted_after, resume_cursor, batch_size)
+        post = self._client.post  # bind once; avoids attribute lookups per page
+
+        def _fetch() -> JobFeedResponse:
+            resp = post("/api/feed/jobs", content=_json.dumps(body), headers=_JSON_HEADERS)
+            _check(resp)
+            return _parse_feed_response(resp.content)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            response = _fetch()
+            while True:
+                next_future = None
+                if response.has_more:
+                    body["cursor"] = response.next_cursor
+                    next_future = executor.submit(_fetch)
+                yield from response.jobs
+                if next_future is None:
+                    break
+                response = next_future.result()
+
+    def iter_jobs_with_cursor(
+        self,
+        *,
+        locations: Optional[List[LocationFilter]] = None,
+        sources: Optional[List[str]] = None,
+        is_remote: Optional[bool] = None,
+        posted_after: Optional[datetime] = None,
+        batch_size: int = 1000,
+        resume_cursor: Optional[str] = None,
+    ) -> Iterator[Tuple[Job, Optional[str]]]:
+        """Iterate over all jobs in the feed, yielding checkpoint cursors.
+
+        Like :meth:`iter_jobs`, but each job comes paired with the cursor
+        of the *next* page (``None`` on the last page). Persist that
+        cursor after processing a job and pass it back as
+        ``resume_cursor`` to continue an interrupted crawl from the start
+        of the following page instead of from scratch.
+
+        Yields:
+            ``(job, next_cursor)`` tuples.
+        """
+        body = _build_feed_body(locations, sources, is_remote, posted_after, resume_cursor, batch_size)
+        post = self._client.post
         while True:
-            response = self.get_jobs(
-                locations=locations,
-                sources=sources,
-                is_remote=is_remote,
-                posted_after=posted_after,
-                cursor=cursor,
-                batch_size=batch_size,
-            )
-            yield from response.jobs
+            resp = post("/api/feed/jobs", content=_json.dumps(body), headers=_JSON_HEADERS)
+            _check(resp)
+            response = _parse_feed_response(resp.content)
+            cursor = response.next_cursor if response.has_more else None
+            for job in response.jobs:
+                yield job, cursor
             if not response.has_more:
                 break
-            cursor = response.next_cursor
+            body["cursor"] = response.next_cursor
+
+    def iter_jobs_streaming(
+        self,
+        *,
+        locations: Optional[List[LocationFilter]] = None,
+        sources: Optional[List[str]] = None,
+        is_remote: Optional[bool] = None,
+        posted_after: Optional[datetime] = None,
+        batch_size: int = 1000,
+        resume_cursor: Optional[str] = None,
+    ) -> Iterator[Job]:
+        """Iterate over all jobs in the feed, parsing pages as they stream in.
+
+        Unlike :meth:`iter_jobs`, which buffers and validates a whole page
+        before yielding, this pipelines network receive with parsing: each
+        job is yielded as soon as its bytes arrive, keeping peak memory
+        per page at one job instead of ``batch_size``. Requires the
+        optional ``ijson`` dependency (``pip install jobo-enterprise[ijson]``).
+
+        Yields:
+            Individual :class:`Job` objects.
+        """
+        if ijson is None:
+            raise ImportError("iter_jobs_streaming requires the optional 'ijson' dependency")
+        body = _build_feed_body(locations, sources, is_remote, posted_after, resume_cursor, batch_size)
+        while True:
+            parser = _FeedPageParser()
+            with self._client.stream(
+                "POST", "/api/feed/jobs", content=_json.dumps(body), headers=_JSON_HEADERS
+            ) as resp:
+                if resp.status_code >= 300:
+                    resp.read()
+                    _handle_error(resp)
+                for chunk in resp.iter_bytes():
+                    for item in parser.push(chunk):
+                        yield Job.model_validate(item)
+                for item in parser.finish():
+                    yield Job.model_validate(item)
+            if not parser.has_more:
+                break
+            body["cursor"] = parser.next_cursor
 
     def get_expired_job_ids(
         self,
@@ -109,6 +323,7 @@ class JobsFeedClient:
         Returns:
             An :class:`ExpiredJobIdsResponse` with job IDs and pagination info.
         """
+        _require_tz_aware("expired_since", expired_since)
         params: dict[str, Union[str, int]] = {
             "expired_since": expired_since.isoformat(),
             "batch_size": batch_size,
@@ -116,32 +331,37 @@ class JobsFeedClient:
         if cursor:
             params["cursor"] = cursor
         resp = self._client.get("/api/feed/jobs/expired", params=params)
-        if resp.status_code != 200:
-            _handle_error(resp)
-        return ExpiredJobIdsResponse.model_validate(resp.json())
+        _check(resp)
+        return _parse_expired_response(resp.content)
 
     def iter_expired_job_ids(
         self,
         *,
         expired_since: datetime,
         batch_size: int = 1000,
-    ) -> Iterator[UUID]:
+        resume_cursor: Optional[str] = None,
+    ) -> Iterator[str]:
         """Iterate over all expired job IDs, automatically handling pagination.
 
         Yields:
-            Individual job UUIDs.
+            Individual job ID strings.
         """
-        cursor: Optional[str] = None
+        _require_tz_aware("expired_since", expired_since)
+        params: dict[str, Union[str, int]] = {
+            "expired_since": expired_since.isoformat(),
+            "batch_size": batch_size,
+        }
+        if resume_cursor:
+            params["cursor"] = resume_cursor
+        get = self._client.get  # bind once; avoids attribute lookups per page
         while True:
-            response = self.get_expired_job_ids(
-                expired_since=expired_since,
-                cursor=cursor,
-                batch_size=batch_size,
-            )
+            resp = get("/api/feed/jobs/expired", params=params)
+            _check(resp)
+            response = _parse_expired_response(resp.content)
             yield from response.job_ids
-            if not response.has_more:
+            if not response.has_more or response.next_cursor is None:
                 break
-            cursor = response.next_cursor
+            params["cursor"] = response.next_cursor
 
 
 class AsyncJobsFeedClient:
@@ -150,8 +370,9 @@ class AsyncJobsFeedClient:
     Access via ``client.feed``.
     """
 
-    def __init__(self, http: httpx.AsyncClient) -> None:
+    def __init__(self, http: httpx.AsyncClient, cache_responses: bool = False) -> None:
         self._client = http
+        self._cache: Optional[ResponseCache[JobFeedResponse]] = ResponseCache() if cache_responses else None
 
     async def get_jobs(
         self,
@@ -163,19 +384,28 @@ class AsyncJobsFeedClient:
         cursor: Optional[str] = None,
         batch_size: int = 1000,
     ) -> JobFeedResponse:
-        """Fetch a single batch of jobs from the feed."""
-        request = JobFeedRequest(
-            locations=locations,
-            sources=sources,
-            is_remote=is_remote,
-            posted_after=posted_after,
-            cursor=cursor,
-            batch_size=batch_size,
-        )
-        resp = await self._client.post("/api/feed/jobs", json=request.model_dump(exclude_none=True))
-        if resp.status_code != 200:
-            _handle_error(resp)
-        return JobFeedResponse.model_validate(resp.json())
+        """Fetch a single batch of jobs from the feed.
+
+        With ``cache_responses`` enabled, a 304 returns the shared cached
+        object; treat it as read-only.
+        """
+        body = _build_feed_body(locations, sources, is_remote, posted_after, cursor, batch_size)
+        content = _json.dumps(body)
+        headers = _JSON_HEADERS
+        cached = self._cache.lookup(content) if self._cache is not None else None
+        if cached is not None:
+            headers = dict(_JSON_HEADERS)
+            headers["If-None-Match"] = cached[0]
+        resp = await self._client.post("/api/feed/jobs", content=content, headers=headers)
+        if cached is not None and resp.status_code == 304:
+            return cached[1]
+        _check(resp)
+        response = _parse_feed_response(resp.content)
+        if self._cache is not None:
+            etag = resp.headers.get("ETag")
+            if etag:
+                self._cache.store(content, etag, response)
+        return response
 
     async def iter_jobs(
         self,
@@ -185,23 +415,115 @@ class AsyncJobsFeedClient:
         is_remote: Optional[bool] = None,
         posted_after: Optional[datetime] = None,
         batch_size: int = 1000,
+        resume_cursor: Optional[str] = None,
     ) -> AsyncIterator[Job]:
-        """Iterate over all jobs in the feed, automatically handling pagination."""
-        cursor: Optional[str] = None
+        """Iterate over all jobs in the feed, automatically handling pagination.
+
+        The next page is requested as soon as the current one arrives, so
+        the fetch overlaps with the caller consuming the current batch.
+        Only the current page's cursor is held; pass a previously saved
+        cursor as ``resume_cursor`` to continue an interrupted crawl (see
+        :meth:`iter_jobs_with_cursor` for checkpointing).
+        """
+        # Only the cursor changes between pages, so build the body once and
+        # reuse it for every page.
+        body = _build_feed_body(locations, sources, is_remote, posted_after, resume_cursor, batch_size)
+
+        async def _fetch() -> JobFeedResponse:
+            resp = await self._client.post("/api/feed/jobs", content=_json.dumps(body), headers=_JSON_HEADERS)
+            _check(resp)
+            return _parse_feed_response(resp.content)
+
+        next_task: Optional["asyncio.Task[JobFeedResponse]"] = None
+        try:
+            response = await _fetch()
+            while True:
+                if response.has_more:
+                    body["cursor"] = response.next_cursor
+                    next_task = asyncio.create_task(_fetch())
+                for job in response.jobs:
+                    yield job
+                if next_task is None:
+                    break
+                response = await next_task
+                next_task = None
+        finally:
+            if next_task is not None:
+                next_task.cancel()
+
+    async def iter_jobs_with_cursor(
+        self,
+        *,
+        locations: Optional[List[LocationFilter]] = None,
+        sources: Optional[List[str]] = None,
+        is_remote: Optional[bool] = None,
+        posted_after: Optional[datetime] = None,
+        batch_size: int = 1000,
+        resume_cursor: Optional[str] = None,
+    ) -> AsyncIterator[Tuple[Job, Optional[str]]]:
+        """Iterate over all jobs in the feed, yielding checkpoint cursors.
+
+        Like :meth:`iter_jobs`, but each job comes paired with the cursor
+        of the *next* page (``None`` on the last page). Persist that
+        cursor after processing a job and pass it back as
+        ``resume_cursor`` to continue an interrupted crawl from the start
+        of the following page instead of from scratch.
+
+        Yields:
+            ``(job, next_cursor)`` tuples.
+        """
+        body = _build_feed_body(locations, sources, is_remote, posted_after, resume_cursor, batch_size)
         while True:
-            response = await self.get_jobs(
-                locations=locations,
-                sources=sources,
-                is_remote=is_remote,
-                posted_after=posted_after,
-                cursor=cursor,
-                batch_size=batch_size,
-            )
+            resp = await self._client.post("/api/feed/jobs", content=_json.dumps(body), headers=_JSON_HEADERS)
+            _check(resp)
+            response = _parse_feed_response(resp.content)
+            cursor = response.next_cursor if response.has_more else None
             for job in response.jobs:
-                yield job
+                yield job, cursor
             if not response.has_more:
                 break
-            cursor = response.next_cursor
+            body["cursor"] = response.next_cursor
+
+    async def iter_jobs_streaming(
+        self,
+        *,
+        locations: Optional[List[LocationFilter]] = None,
+        sources: Optional[List[str]] = None,
+        is_remote: Optional[bool] = None,
+        posted_after: Optional[datetime] = None,
+        batch_size: int = 1000,
+        resume_cursor: Optional[str] = None,
+    ) -> AsyncIterator[Job]:
+        """Iterate over all jobs in the feed, parsing pages as they stream in.
+
+        Unlike :meth:`iter_jobs`, which buffers and validates a whole page
+        before yielding, this pipelines network receive with parsing: each
+        job is yielded as soon as its bytes arrive, keeping peak memory
+        per page at one job instead of ``batch_size``. Requires the
+        optional ``ijson`` dependency (``pip install jobo-enterprise[ijson]``).
+
+        Yields:
+            Individual :class:`Job` objects.
+        """
+        if ijson is None:
+            raise ImportError("iter_jobs_streaming requires the optional 'ijson' dependency")
+        body = _build_feed_body(locations, sources, is_remote, posted_after, resume_cursor, batch_size)
+        while True:
+            parser = _FeedPageParser()
+            async with self._client.stream(
+                "POST", "/api/feed/jobs", content=_json.dumps(body), headers=_JSON_HEADERS
+            ) as resp:
+                if resp.status_code >= 300:
+                    await resp.aread()
+                    _handle_error(resp)
+                async for chunk in resp.aiter_bytes():
+                    for item in parser.push(chunk):
+                        yield Job.model_validate(item)
+                for item in parser.finish():
+                    yield Job.model_validate(item)
+            if not parser.has_more:
+                break
+            body["cursor"] = parser.next_cursor
 
     async def get_expired_job_ids(
         self,
@@ -211,6 +533,7 @@ class AsyncJobsFeedClient:
         batch_size: int = 1000,
     ) -> ExpiredJobIdsResponse:
         """Fetch a single batch of expired job IDs."""
+        _require_tz_aware("expired_since", expired_since)
         params: dict[str, Union[str, int]] = {
             "expired_since": expired_since.isoformat(),
             "batch_size": batch_size,
@@ -218,26 +541,31 @@ class AsyncJobsFeedClient:
         if cursor:
             params["cursor"] = cursor
         resp = await self._client.get("/api/feed/jobs/expired", params=params)
-        if resp.status_code != 200:
-            _handle_error(resp)
-        return ExpiredJobIdsResponse.model_validate(resp.json())
+        _check(resp)
+        return _parse_expired_response(resp.content)
 
     async def iter_expired_job_ids(
         self,
         *,
         expired_since: datetime,
         batch_size: int = 1000,
-    ) -> AsyncIterator[UUID]:
+        resume_cursor: Optional[str] = None,
+    ) -> AsyncIterator[str]:
         """Iterate over all expired job IDs, automatically handling pagination."""
-        cursor: Optional[str] = None
+        _require_tz_aware("expired_since", expired_since)
+        params: dict[str, Union[str, int]] = {
+            "expired_since": expired_since.isoformat(),
+            "batch_size": batch_size,
+        }
+        if resume_cursor:
+            params["cursor"] = resume_cursor
+        get = self._client.get  # bind once; avoids attribute lookups per page
         while True:
-            response = await self.get_expired_job_ids(
-                expired_since=expired_since,
-                cursor=cursor,
-                batch_size=batch_size,
-            )
+            resp = await get("/api/feed/jobs/expired", params=params)
+            _check(resp)
+            response = _parse_expired_response(resp.content)
             for job_id in response.job_ids:
                 yield job_id
-            if not response.has_more:
+            if not response.has_more or response.next_cursor is None:
                 break
-            cursor = response.next_cursor
+            params["cursor"] = response.next_cursor
@@ -2,20 +2,38 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Sequence
+
 import httpx
 
-from jobo_enterprise.exceptions import _handle_error
+from jobo_enterprise._http import _check
 from jobo_enterprise.models import GeocodeResultItem
 
+_GEOCODE_CACHE_MAXSIZE = 4096
+
+
+def _cache_key(location: str) -> str:
+    return location.strip().casefold()
+
 
 class LocationsClient:
     """Synchronous sub-client for the Locations/Geocoding endpoints.
 
     Access via ``client.locations``.
+
+    Geocode results are memoized per client instance in a bounded LRU cache
+    keyed by the normalized location string, so repeated lookups of the same
+    location ("San Francisco, CA", "London, UK") skip the network entirely.
     """
 
     def __init__(self, http: httpx.Client) -> None:
         self._client = http
+        self._cache: "OrderedDict[str, GeocodeResultItem]" = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def geocode(self, location: str) -> GeocodeResultItem:
         """Geocode a location string into structured locations with coordinates.
@@ -24,23 +42,76 @@ class LocationsClient:
             location: The location string to geocode (e.g., "San Francisco, CA" or "London, UK").
 
         Returns:
-            A :class:`GeocodeResultItem` with resolved locations.
+            A :class:`GeocodeResultItem` with resolved locations. Results are
+            cached; treat them as read-only.
         """
+        key = _cache_key(location)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
         params = {"location": location}
         resp = self._client.get("/api/locations/geocode", params=params)
-        if resp.status_code != 200:
-            _handle_error(resp)
-        return GeocodeResultItem.model_validate(resp.json())
+        _check(resp)
+        result = GeocodeResultItem.model_validate_json(resp.content)
+
+        with self._cache_lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > _GEOCODE_CACHE_MAXSIZE:
+                self._cache.popitem(last=False)
+        return result
+
+    def geocode_many(
+        self,
+        locations: Sequence[str],
+        *,
+        concurrency: int = 16,
+    ) -> Dict[str, GeocodeResultItem]:
+        """Geocode many locations concurrently.
+
+        Duplicate inputs (after normalization) are resolved once; the
+        underlying ``httpx.Client`` is thread-safe, so requests run in
+        parallel over the shared connection pool.
+
+        Args:
+            locations: Location strings to geocode.
+            concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            A dict mapping each input string to its :class:`GeocodeResultItem`,
+            preserving input order.
+        """
+        unique: "OrderedDict[str, str]" = OrderedDict()
+        for location in locations:
+            unique.setdefault(_cache_key(location), location)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            resolved = dict(zip(unique, executor.map(self.geocode, unique.values())))
+        return {location: resolved[_cache_key(location)] for location in locations}
+
+    def clear_geocode_cache(self) -> None:
+        """Drop all memoized geocode results."""
+        with self._cache_lock:
+            self._cache.clear()
 
 
 class AsyncLocationsClient:
     """Asynchronous sub-client for the Locations/Geocoding endpoints.
 
     Access via ``client.locations``.
+
+    Geocode results are memoized per client instance in a bounded LRU cache
+    keyed by the normalized location string. Concurrent lookups of the same
+    location share a single in-flight request.
     """
 
     def __init__(self, http: httpx.AsyncClient) -> None:
         self._client = http
+        self._cache: "OrderedDict[str, GeocodeResultItem]" = OrderedDict()
+        self._inflight: dict[str, "asyncio.Future[GeocodeResultItem]"] = {}
 
     async def geocode(self, location: str) -> GeocodeResultItem:
         """Geocode a location string into structured locations with coordinates.
@@ -49,10 +120,79 @@ class AsyncLocationsClient:
             location: The location string to geocode (e.g., "San Francisco, CA" or "London, UK").
 
         Returns:
-            A :class:`GeocodeResultItem` with resolved locations.
+            A :class:`GeocodeResultItem` with resolved locations. Results are
+            cached; treat them as read-only.
         """
+        key = _cache_key(location)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future: "asyncio.Future[GeocodeResultItem]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._fetch(location)
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Waiters observe the exception; avoid "never retrieved" warnings
+            # when nobody else was awaiting this key.
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+        future.set_result(result)
+
+        self._cache[key] = result
+        self._cache.move_to_end(key)
+        while len(self._cache) > _GEOCODE_CACHE_MAXSIZE:
+            self._cache.popitem(last=False)
+        return result
+
+    async def _fetch(self, location: str) -> GeocodeResultItem:
         params = {"location": location}
         resp = await self._client.get("/api/locations/geocode", params=params)
-        if resp.status_code != 200:
-            _handle_error(resp)
-        return GeocodeResultItem.model_validate(resp.json())
+        _check(resp)
+        return GeocodeResultItem.model_validate_json(resp.content)
+
+    async def geocode_many(
+        self,
+        locations: Sequence[str],
+        *,
+        concurrency: int = 16,
+    ) -> Dict[str, GeocodeResultItem]:
+        """Geocode many locations concurrently.
+
+        Duplicate inputs (after normalization) are resolved once, and at most
+        ``concurrency`` requests are in flight at a time — with HTTP/2 they
+        multiplex over a single connection.
+
+        Args:
+            locations: Location strings to geocode.
+            concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            A dict mapping each input string to its :class:`GeocodeResultItem`,
+            preserving input order.
+        """
+        unique: "OrderedDict[str, str]" = OrderedDict()
+        for location in locations:
+            unique.setdefault(_cache_key(location), location)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _geocode(location: str) -> GeocodeResultItem:
+            async with semaphore:
+                return await self.geocode(location)
+
+        results = await asyncio.gather(*(_geocode(location) for location in unique.values()))
+        resolved = dict(zip(unique, results))
+        return {location: resolved[_cache_key(location)] for location in locations}
+
+    def clear_geocode_cache(self) -> None:
+        """Drop all memoized geocode results."""
+        self._cache.clear()
@@ -3,22 +3,64 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import cached_property
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+__all__ = [
+    "JobCompany",
+    "JobLocation",
+    "JobCompensation",
+    "Job",
+    "LocationFilter",
+    "JobFeedRequest",
+    "JobFeedResponse",
+    "ExpiredJobIdsResponse",
+    "JobSearchRequest",
+    "JobSearchResponse",
+    "GeocodedLocation",
+    "GeocodeResultItem",
+    "FieldAnswerFile",
+    "FieldAnswer",
+    "StartAutoApplySessionRequest",
+    "SetAutoApplyAnswersRequest",
+    "ValidationError",
+    "FieldOption",
+    "FieldValidations",
+    "FormFieldInfo",
+    "AutoApplySessionResponse",
+]
+
+
+# Hot response models, allocated up to 1000x per page: frozen lets
+# pydantic-core skip mutability bookkeeping (and makes instances safely
+# shareable, e.g. from the ETag cache), extra="ignore" drops unknown keys
+# without collecting them, and populate_by_name keeps aliased fields
+# fillable by their Python names.
+_HOT_MODEL_CONFIG = ConfigDict(frozen=True, extra="ignore", populate_by_name=True)
 
 
 class JobCompany(BaseModel):
     """Company associated with a job listing."""
 
-    id: UUID
+    model_config = _HOT_MODEL_CONFIG
+
+    id: str
     name: str
 
+    @cached_property
+    def uuid(self) -> UUID:
+        """The company ID parsed as a :class:`~uuid.UUID`."""
+        return UUID(self.id)
+
 
 class JobLocation(BaseModel):
     """Geographic location of a job."""
 
+    model_config = _HOT_MODEL_CONFIG
+
     location: Optional[str] = None
     city: Optional[str] = None
     state: Optional[str] = None
@@ -30,8 +72,10 @@ class JobLocation(BaseModel):
 class JobCompensation(BaseModel):
     """Compensation details for a job."""
 
-    min: Optional[float] = Field(None, alias="min")
-    max: Optional[float] = Field(None, alias="max")
+    model_config = _HOT_MODEL_CONFIG
+
+    min: Optional[float] = None
+    max: Optional[float] = None
     currency: Optional[str] = None
     period: Optional[str] = None
     raw_text: Optional[str] = None
@@ -39,9 +83,16 @@ class JobCompensation(BaseModel):
 
 
 class Job(BaseModel):
-    """A job listing returned by the API."""
+    """A job listing returned by the API.
 
-    id: UUID
+    IDs arrive as strings and are kept that way — parsing thousands of
+    UUIDs per page costs real time and most callers only compare or
+    re-serialize them. Use :attr:`uuid` when the parsed form is needed.
+    """
+
+    model_config = _HOT_MODEL_CONFIG
+
+    id: str
     title: str
     company: JobCompany
     description: str
@@ -60,6 +111,11 @@ class Job(BaseModel):
     valid_through: Optional[datetime] = None
     is_remote: bool = False
 
+    @cached_property
+    def uuid(self) -> UUID:
+        """The job ID parsed as a :class:`~uuid.UUID`."""
+        return UUID(self.id)
+
 
 class LocationFilter(BaseModel):
     """Structured location filter for the feed endpoint."""
@@ -91,7 +147,7 @@ class JobFeedResponse(BaseModel):
 class ExpiredJobIdsResponse(BaseModel):
     """Response from the expired job IDs endpoint."""
 
-    job_ids: List[UUID] = Field(default_factory=list)
+    job_ids: List[str] = Field(default_factory=list)
     next_cursor: Optional[str] = None
     has_more: bool = False
 
@@ -124,6 +180,8 @@ class JobSearchResponse(BaseModel):
 class GeocodedLocation(BaseModel):
     """A resolved/geocoded location."""
 
+    model_config = ConfigDict(defer_build=True)
+
     display_name: str
     city: Optional[str] = None
     region: Optional[str] = None
@@ -136,6 +194,8 @@ class GeocodedLocation(BaseModel):
 class GeocodeResultItem(BaseModel):
     """Response from the geocode endpoint."""
 
+    model_config = ConfigDict(defer_build=True)
+
     input: str
     succeeded: bool
     locations: List[GeocodedLocation] = Field(default_factory=list)
@@ -149,6 +209,8 @@ class GeocodeResultItem(BaseModel):
 class FieldAnswerFile(BaseModel):
     """A file upload answer for auto-apply."""
 
+    model_config = ConfigDict(defer_build=True)
+
     file_name: str
     content_type: str
     data: str  # Base64 encoded
@@ -157,6 +219,8 @@ class FieldAnswerFile(BaseModel):
 class FieldAnswer(BaseModel):
     """A field answer for auto-apply."""
 
+    model_config = ConfigDict(defer_build=True)
+
     field_id: str
     value: Optional[str] = None
     values: Optional[List[str]] = None
@@ -166,12 +230,16 @@ class FieldAnswer(BaseModel):
 class StartAutoApplySessionRequest(BaseModel):
     """Request to start an auto-apply session."""
 
+    model_config = ConfigDict(defer_build=True)
+
     apply_url: str
 
 
 class SetAutoApplyAnswersRequest(BaseModel):
     """Request to set answers for an auto-apply session."""
 
+    model_config = ConfigDict(defer_build=True)
+
     session_id: UUID
     answers: List[FieldAnswer]
 
@@ -179,6 +247,8 @@ class SetAutoApplyAnswersRequest(BaseModel):
 class ValidationError(BaseModel):
     """Validation error from auto-apply."""
 
+    model_config = ConfigDict(defer_build=True)
+
     field_id: str
     message: str
 
@@ -186,6 +256,8 @@ class ValidationError(BaseModel):
 class FieldOption(BaseModel):
     """Option for a select/radio field."""
 
+    model_config = ConfigDict(defer_build=True)
+
     value: str
     label: Optional[str] = None
 
@@ -193,6 +265,8 @@ class FieldOption(BaseModel):
 class FieldValidations(BaseModel):
     """Validations for a form field."""
 
+    model_config = ConfigDict(defer_build=True)
+
     min_length: Optional[int] = None
     max_length: Optional[int] = None
     pattern: Optional[str] = None
@@ -201,6 +275,8 @@ class FieldValidations(BaseModel):
 class FormFieldInfo(BaseModel):
     """Information about a form field in auto-apply."""
 
+    model_config = ConfigDict(defer_build=True)
+
     id: str
     type: str
     label: Optional[str] = None
@@ -213,6 +289,8 @@ class FormFieldInfo(BaseModel):
 class AutoApplySessionResponse(BaseModel):
     """Response from an auto-apply session operation."""
 
+    model_config = ConfigDict(defer_build=True)
+
     session_id: UUID
     provider_id: str
     provider_display_name: str
@@ -2,18 +2,164 @@
 
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import AsyncIterator, Iterator, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
 
 import httpx
+from pydantic import TypeAdapter
 
-from jobo_enterprise.exceptions import _handle_error
+from jobo_enterprise import _json
+from jobo_enterprise._cache import ResponseCache
+from jobo_enterprise._http import _check, _decode
 from jobo_enterprise.models import (
     Job,
-    JobSearchRequest,
+    JobCompany,
+    JobCompensation,
+    JobLocation,
     JobSearchResponse,
 )
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Matches the tuple-list element type httpx accepts for ``params``.
+_QueryValue = Union[str, int, float, bool, None]
+
+# Process-global and thread-safe: the adapter holds the core-schema
+# validator once, skipping the model_validate_json classmethod dispatch
+# on every page.
+_SEARCH_ADAPTER: TypeAdapter[JobSearchResponse] = TypeAdapter(JobSearchResponse)
+
+
+def _build_advanced_body(
+    queries: Optional[List[str]],
+    locations: Optional[List[str]],
+    sources: Optional[List[str]],
+    is_remote: Optional[bool],
+    posted_after: Optional[datetime],
+    page: int,
+    page_size: int,
+) -> Dict[str, Any]:
+    """Build an advanced-search body directly, bypassing :class:`JobSearchRequest`.
+
+    The schema is flat and our own kwargs are known-good, so the public
+    request model is skipped on this internal path, mirroring the feed's
+    body builder.
+    """
+    body: Dict[str, Any] = {"page": page, "page_size": page_size}
+    if queries is not None:
+        body["queries"] = queries
+    if locations is not None:
+        body["locations"] = locations
+    if sources is not None:
+        body["sources"] = sources
+    if is_remote is not None:
+        body["is_remote"] = is_remote
+    if posted_after is not None:
+        body["posted_after"] = posted_after.isoformat()
+    return body
+
+
+def _parse_dt(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO-8601 timestamp, tolerating a trailing ``Z``.
+
+    ``datetime.fromisoformat`` only accepts ``Z`` from Python 3.11 on.
+    """
+    if value is None:
+        return None
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+def _construct_job(d: Dict[str, Any]) -> Job:
+    """Build a :class:`Job` from a trusted server dict, skipping validation.
+
+    ``model_construct`` bypasses pydantic-core entirely, which is the bulk
+    of the per-job cost on large pages. Only safe for payloads straight
+    from the API — nothing here checks types or required fields.
+    """
+    compensation = d.get("compensation")
+    return Job.model_construct(
+        id=d["id"],
+        title=d["title"],
+        company=JobCompany.model_construct(id=d["company"]["id"], name=d["company"]["name"]),
+        description=d["description"],
+        listing_url=d["listing_url"],
+        apply_url=d["apply_url"],
+        locations=[JobLocation.model_construct(**loc) for loc in d.get("locations") or []],
+        compensation=JobCompensation.model_construct(**compensation) if compensation else None,
+        employment_type=d.get("employment_type"),
+        workplace_type=d.get("workplace_type"),
+        experience_level=d.get("experience_level"),
+        source=d["source"],
+        source_id=d["source_id"],
+        created_at=_parse_dt(d["created_at"]),
+        updated_at=_parse_dt(d["updated_at"]),
+        date_posted=_parse_dt(d.get("date_posted")),
+        valid_through=_parse_dt(d.get("valid_through")),
+        is_remote=d.get("is_remote", False),
+    )
+
+
+def _construct_search_response(content: bytes) -> JobSearchResponse:
+    """Build a :class:`JobSearchResponse` from trusted bytes without validation."""
+    data = _json.loads(content)
+    return JobSearchResponse.model_construct(
+        jobs=[_construct_job(item) for item in data.get("jobs", [])],
+        total=data.get("total", 0),
+        page=data.get("page", 1),
+        page_size=data.get("page_size", 25),
+        total_pages=data.get("total_pages", 0),
+    )
+
+
+def _page_request(template: httpx.Request, body: Dict[str, Any]) -> httpx.Request:
+    """Stamp out one pagination request from a prebuilt template.
+
+    The template already carries the joined URL, merged client headers and
+    extensions (where build_request records the timeout), so per-page cost
+    is one serialize plus a header copy with a fresh Content-Length — no
+    URL join or default-header merge per page.
+    """
+    content = _json.dumps(body)
+    headers = template.headers.copy()
+    headers["Content-Length"] = str(len(content))
+    return httpx.Request(
+        template.method, template.url, headers=headers, content=content, extensions=template.extensions
+    )
+
+
+def _build_search_params(
+    q: Optional[str],
+    location: Optional[str],
+    sources: Optional[str],
+    remote: Optional[bool],
+    posted_after: Optional[datetime],
+    page: int,
+    page_size: int,
+) -> List[Tuple[str, _QueryValue]]:
+    """Build simple-search query params as a flat tuple list.
+
+    httpx accepts sequences of pairs directly, so this skips the dict
+    round-trip on every call; shared by the sync and async clients.
+    """
+    params: List[Tuple[str, _QueryValue]] = []
+    if q:
+        params.append(("q", q))
+    if location:
+        params.append(("location", location))
+    if sources:
+        params.append(("sources", sources))
+    if remote is not None:
+        params.append(("remote", remote))
+    if posted_after:
+        params.append(("posted_after", posted_after.isoformat()))
+    params.append(("page", page))
+    params.append(("page_size", page_size))
+    return params
+
 
 class JobsSearchClient:
     """Synchronous sub-client for the Jobs Search endpoints.
@@ -21,8 +167,9 @@ class JobsSearchClient:
     Access via ``client.search``.
     """
 
-    def __init__(self, http: httpx.Client) -> None:
+    def __init__(self, http: httpx.Client, cache_responses: bool = False) -> None:
         self._client = http
+        self._cache: Optional[ResponseCache[JobSearchResponse]] = ResponseCache() if cache_responses else None
 
     def search(
         self,
@@ -48,25 +195,22 @@ class JobsSearchClient:
 
         Returns:
             A :class:`JobSearchResponse` with jobs and pagination metadata.
+            With ``cache_responses`` enabled, a 304 returns the shared cached
+            object; treat it as read-only.
         """
-        params: dict[str, Union[str, int, bool]] = {}
-        if q:
-            params["q"] = q
-        if location:
-            params["location"] = location
-        if sources:
-            params["sources"] = sources
-        if remote is not None:
-            params["remote"] = remote
-        if posted_after:
-            params["posted_after"] = posted_after.isoformat()
-        params["page"] = page
-        params["page_size"] = page_size
-
-        resp = self._client.get("/api/jobs", params=params)
-        if resp.status_code != 200:
-            _handle_error(resp)
-        return JobSearchResponse.model_validate(resp.json())
+        params = _build_search_params(q, location, sources, remote, posted_after, page, page_size)
+        key = tuple(sorted(params))
+        cached = self._cache.lookup(key) if self._cache is not None else None
+        headers = {"If-None-Match": cached[0]} if cached is not None else None
+        resp = self._client.get("/api/jobs", params=params, headers=headers)
+        if cached is not None and resp.status_code == 304:
+            return cached[1]
+        response = _decode(resp, _SEARCH_ADAPTER)
+        if self._cache is not None:
+            etag = resp.headers.get("ETag")
+            if etag:
+                self._cache.store(key, etag, response)
+        return response
 
     def search_advanced(
         self,
@@ -78,6 +222,7 @@ class JobsSearchClient:
         posted_after: Optional[datetime] = None,
         page: int = 1,
         page_size: int = 25,
+        fast: bool = False,
     ) -> JobSearchResponse:
         """Search jobs using the advanced body-based endpoint (POST /api/jobs/search).
 
@@ -89,23 +234,64 @@ class JobsSearchClient:
             posted_after: Only jobs posted after this UTC datetime.
             page: Page number (1-indexed).
             page_size: Results per page (1–100).
+            fast: Skip response validation and construct models directly.
+                Assumes the server payload is well-formed; malformed data
+                surfaces as ``KeyError``/``ValueError`` instead of a
+                pydantic ``ValidationError``.
 
         Returns:
             A :class:`JobSearchResponse` with jobs and pagination metadata.
         """
-        request = JobSearchRequest(
-            queries=queries,
-            locations=locations,
-            sources=sources,
-            is_remote=is_remote,
-            posted_after=posted_after,
-            page=page,
-            page_size=page_size,
-        )
-        resp = self._client.post("/api/jobs/search", json=request.model_dump(exclude_none=True))
-        if resp.status_code != 200:
-            _handle_error(resp)
-        return JobSearchResponse.model_validate(resp.json())
+        body = _build_advanced_body(queries, locations, sources, is_remote, posted_after, page, page_size)
+        resp = self._client.post("/api/jobs/search", content=_json.dumps(body), headers=_JSON_HEADERS)
+        _check(resp)
+        if fast:
+            return _construct_search_response(resp.content)
+        return _SEARCH_ADAPTER.validate_json(resp.content)
+
+    def iter_pages(
+        self,
+        *,
+        queries: Optional[List[str]] = None,
+        locations: Optional[List[str]] = None,
+        sources: Optional[List[str]] = None,
+        is_remote: Optional[bool] = None,
+        posted_after: Optional[datetime] = None,
+        page_size: int = 25,
+    ) -> Iterator[List[Job]]:
+        """Iterate over search results one page at a time.
+
+        Uses the advanced search endpoint under the hood. While the caller
+        is consuming a page, the next one is fetched on a background
+        thread; at most one page is in flight. Bulk consumers (database
+        writes, exports) get whole lists without per-item yields.
+
+        Yields:
+            Lists of :class:`Job` objects, one per page.
+        """
+
+        body = _build_advanced_body(queries, locations, sources, is_remote, posted_after, 1, page_size)
+        template = self._client.build_request("POST", "/api/jobs/search", headers=_JSON_HEADERS)
+
+        def _fetch(page: int) -> JobSearchResponse:
+            body["page"] = page
+            resp = self._client.send(_page_request(template, body))
+            return _decode(resp, _SEARCH_ADAPTER)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page = 1
+            response = _fetch(page)
+            while True:
+                next_future = None
+                # A short page also means we're done, even if total_pages
+                # is stale — saves the final empty round-trip.
+                if page < response.total_pages and len(response.jobs) >= page_size:
+                    next_future = executor.submit(_fetch, page + 1)
+                yield response.jobs
+                if next_future is None:
+                    break
+                page += 1
+                response = next_future.result()
 
     def iter_jobs(
         self,
@@ -119,26 +305,20 @@ class JobsSearchClient:
     ) -> Iterator[Job]:
         """Iterate over all search results, automatically handling pagination.
 
-        Uses the advanced search endpoint under the hood.
+        Thin wrapper over :meth:`iter_pages` that flattens each page.
 
         Yields:
             Individual :class:`Job` objects.
         """
-        page = 1
-        while True:
-            response = self.search_advanced(
-                queries=queries,
-                locations=locations,
-                sources=sources,
-                is_remote=is_remote,
-                posted_after=posted_after,
-                page=page,
-                page_size=page_size,
-            )
-            yield from response.jobs
-            if page >= response.total_pages:
-                break
-            page += 1
+        for jobs in self.iter_pages(
+            queries=queries,
+            locations=locations,
+            sources=sources,
+            is_remote=is_remote,
+            posted_after=posted_after,
+            page_size=page_size,
+        ):
+            yield from jobs
 
 
 class AsyncJobsSearchClient:
@@ -147,8 +327,9 @@ class AsyncJobsSearchClient:
     Access via ``client.search``.
     """
 
-    def __init__(self, http: httpx.AsyncClient) -> None:
+    def __init__(self, http: httpx.AsyncClient, cache_responses: bool = False) -> None:
         self._client = http
+        self._cache: Optional[ResponseCache[JobSearchResponse]] = ResponseCache() if cache_responses else None
 
     async def search(
         self,
@@ -161,25 +342,24 @@ class AsyncJobsSearchClient:
         page: int = 1,
         page_size: int = 25,
     ) -> JobSearchResponse:
-        """Search jobs using simple query parameters (GET /api/jobs)."""
-        params: dict[str, Union[str, int, bool]] = {}
-        if q:
-            params["q"] = q
-        if location:
-            params["location"] = location
-        if sources:
-            params["sources"] = sources
-        if remote is not None:
-            params["remote"] = remote
-        if posted_after:
-            params["posted_after"] = posted_after.isoformat()
-        params["page"] = page
-        params["page_size"] = page_size
-
-        resp = await self._client.get("/api/jobs", params=params)
-        if resp.status_code != 200:
-            _handle_error(resp)
-        return JobSearchResponse.model_validate(resp.json())
+        """Search jobs using simple query parameters (GET /api/jobs).
+
+        With ``cache_responses`` enabled, a 304 returns the shared cached
+        object; treat it as read-only.
+        """
+        params = _build_search_params(q, location, sources, remote, posted_after, page, page_size)
+        key = tuple(sorted(params))
+        cached = self._cache.lookup(key) if self._cache is not None else None
+        headers = {"If-None-Match": cached[0]} if cached is not None else None
+        resp = await self._client.get("/api/jobs", params=params, headers=headers)
+        if cached is not None and resp.status_code == 304:
+            return cached[1]
+        response = _decode(resp, _SEARCH_ADAPTER)
+        if self._cache is not None:
+            etag = resp.headers.get("ETag")
+            if etag:
+                self._cache.store(key, etag, response)
+        return response
 
     async def search_advanced(
         self,
@@ -191,23 +371,107 @@ class AsyncJobsSearchClient:
         posted_after: Optional[datetime] = None,
         page: int = 1,
         page_size: int = 25,
+        fast: bool = False,
     ) -> JobSearchResponse:
-        """Search jobs using the advanced body-based endpoint (POST /api/jobs/search)."""
-        request = JobSearchRequest(
+        """Search jobs using the advanced body-based endpoint (POST /api/jobs/search).
+
+        With ``fast=True`` the response is constructed without validation;
+        the payload is assumed well-formed.
+        """
+        body = _build_advanced_body(queries, locations, sources, is_remote, posted_after, page, page_size)
+        resp = await self._client.post("/api/jobs/search", content=_json.dumps(body), headers=_JSON_HEADERS)
+        _check(resp)
+        if fast:
+            return _construct_search_response(resp.content)
+        return _SEARCH_ADAPTER.validate_json(resp.content)
+
+    async def iter_pages(
+        self,
+        *,
+        queries: Optional[List[str]] = None,
+        locations: Optional[List[str]] = None,
+        sources: Optional[List[str]] = None,
+        is_remote: Optional[bool] = None,
+        posted_after: Optional[datetime] = None,
+        page_size: int = 25,
+        prefetch: int = 8,
+    ) -> AsyncIterator[List[Job]]:
+        """Iterate over search results one page at a time.
+
+        Once the first page reveals ``total_pages``, the remaining pages are
+        fetched concurrently (at most ``prefetch`` in flight) and yielded in
+        page order. Bulk consumers get whole lists without per-item yields.
+
+        Yields:
+            Lists of :class:`Job` objects, one per page.
+        """
+        body = _build_advanced_body(queries, locations, sources, is_remote, posted_after, 1, page_size)
+        template = self._client.build_request("POST", "/api/jobs/search", headers=_JSON_HEADERS)
+
+        async def _fetch(page: int) -> JobSearchResponse:
+            # body mutation and serialization happen without an await in
+            # between, so concurrent fetch tasks can't interleave here.
+            body["page"] = page
+            request = _page_request(template, body)
+            resp = await self._client.send(request)
+            return _decode(resp, _SEARCH_ADAPTER)
+
+        response = await _fetch(1)
+        yield response.jobs
+        total_pages = response.total_pages
+        # A short first page also means we're done, even if total_pages is
+        # stale — avoids scheduling fetches that would come back empty.
+        if total_pages <= 1 or len(response.jobs) < page_size:
+            return
+
+        semaphore = asyncio.Semaphore(prefetch)
+
+        async def _fetch_page(page: int) -> JobSearchResponse:
+            async with semaphore:
+                return await _fetch(page)
+
+        tasks = [asyncio.create_task(_fetch_page(page)) for page in range(2, total_pages + 1)]
+        try:
+            for task in tasks:
+                response = await task
+                yield response.jobs
+                if len(response.jobs) < page_size:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def iter_jobs(
+        self,
+        *,
+        queries: Optional[List[str]] = None,
+        locations: Optional[List[str]] = None,
+        sources: Optional[List[str]] = None,
+        is_remote: Optional[bool] = None,
+        posted_after: Optional[datetime] = None,
+        page_size: int = 25,
+        prefetch: int = 8,
+    ) -> AsyncIterator[Job]:
+        """Iterate over all search results, automatically handling pagination.
+
+        Thin wrapper over :meth:`iter_pages` that flattens each page.
+
+        Yields:
+            Individual :class:`Job` objects.
+        """
+        async for jobs in self.iter_pages(
             queries=queries,
             locations=locations,
             sources=sources,
             is_remote=is_remote,
             posted_after=posted_after,
-            page=page,
             page_size=page_size,
-        )
-        resp = await self._client.post("/api/jobs/search", json=request.model_dump(exclude_none=True))
-        if resp.status_code != 200:
-            _handle_error(resp)
-        return JobSearchResponse.model_validate(resp.json())
+            prefetch=prefetch,
+        ):
+            for job in jobs:
+                yield job
 
-    async def iter_jobs(
+    async def fetch_all(
         self,
         *,
         queries: Optional[List[str]] = None,
@@ -215,22 +479,42 @@ class AsyncJobsSearchClient:
         sources: Optional[List[str]] = None,
         is_remote: Optional[bool] = None,
         posted_after: Optional[datetime] = None,
-        page_size: int = 25,
-    ) -> AsyncIterator[Job]:
-        """Iterate over all search results, automatically handling pagination."""
-        page = 1
-        while True:
-            response = await self.search_advanced(
-                queries=queries,
-                locations=locations,
-                sources=sources,
-                is_remote=is_remote,
-                posted_after=posted_after,
-                page=page,
-                page_size=page_size,
-            )
-            for job in response.jobs:
-                yield job
-            if page >= response.total_pages:
-                break
-            page += 1
+        page_size: int = 100,
+        max_concurrency: int = 8,
+    ) -> List[Job]:
+        """Fetch every page of results concurrently and return all jobs.
+
+        After page 1 reveals ``total_pages``, the remaining pages are
+        gathered with at most ``max_concurrency`` requests in flight, so
+        wall time approaches a single page's round-trip. The result is in
+        page order. Holds every job in memory — prefer :meth:`iter_jobs`
+        for very large result sets.
+
+        Returns:
+            All matching :class:`Job` objects.
+        """
+        body = _build_advanced_body(queries, locations, sources, is_remote, posted_after, 1, page_size)
+        template = self._client.build_request("POST", "/api/jobs/search", headers=_JSON_HEADERS)
+
+        async def _fetch(page: int) -> JobSearchResponse:
+            # body mutation and serialization happen without an await in
+            # between, so concurrent fetch tasks can't interleave here.
+            body["page"] = page
+            resp = await self._client.send(_page_request(template, body))
+            return _decode(resp, _SEARCH_ADAPTER)
+
+        first = await _fetch(1)
+        jobs = list(first.jobs)
+        if first.total_pages <= 1 or len(first.jobs) < page_size:
+            return jobs
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _fetch_page(page: int) -> JobSearchResponse:
+            async with semaphore:
+                return await _fetch(page)
+
+        responses = await asyncio.gather(*(_fetch_page(page) for page in range(2, first.total_pages + 1)))
+        for response in responses:
+            jobs.extend(response.jobs)
+        return jobs
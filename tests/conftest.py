@@ -12,13 +12,16 @@ API_KEY = os.environ.get("JOBO_API_KEY", "")
 BASE_URL = os.environ.get("JOBO_BASE_URL", "https://jobs-api.jobo.world")
 
 
-@pytest.fixture
+# Session scope: one client (and one connection pool) for the whole run,
+# so the TLS/HTTP2 handshake is paid once instead of per test. Tests must
+# not mutate client state.
+@pytest.fixture(scope="session")
 def client():
     with JoboClient(api_key=API_KEY, base_url=BASE_URL) as c:
         yield c
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def async_client():
     c = AsyncJoboClient(api_key=API_KEY, base_url=BASE_URL)
     yield c
@@ -0,0 +1,75 @@
+"""Offline tests for the opt-in ETag response cache, mocked with pytest-httpx."""
+
+from __future__ import annotations
+
+from pytest_httpx import HTTPXMock
+
+from jobo_enterprise.client import JoboClient
+
+BASE_URL = "https://cache.example.test"
+
+_SEARCH_PAGE = {"jobs": [], "total": 0, "page": 1, "page_size": 25, "total_pages": 0}
+_FEED_PAGE = {"jobs": [], "next_cursor": None, "has_more": False}
+
+
+class TestSearchResponseCache:
+    def test_304_returns_cached_object(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json=_SEARCH_PAGE, headers={"ETag": '"v1"'})
+        httpx_mock.add_response(status_code=304)
+
+        with JoboClient(api_key="test-key", base_url=BASE_URL, cache_responses=True) as client:
+            first = client.search.search(q="python")
+            second = client.search.search(q="python")
+
+        assert second is first
+        requests = httpx_mock.get_requests()
+        assert "If-None-Match" not in requests[0].headers
+        assert requests[1].headers["If-None-Match"] == '"v1"'
+
+    def test_no_etag_means_no_conditional_request(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json=_SEARCH_PAGE)
+        httpx_mock.add_response(json=_SEARCH_PAGE)
+
+        with JoboClient(api_key="test-key", base_url=BASE_URL, cache_responses=True) as client:
+            first = client.search.search(q="python")
+            second = client.search.search(q="python")
+
+        assert second is not first
+        for request in httpx_mock.get_requests():
+            assert "If-None-Match" not in request.headers
+
+    def test_cache_off_by_default(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json=_SEARCH_PAGE, headers={"ETag": '"v1"'})
+        httpx_mock.add_response(json=_SEARCH_PAGE, headers={"ETag": '"v1"'})
+
+        with JoboClient(api_key="test-key", base_url=BASE_URL) as client:
+            client.search.search(q="python")
+            client.search.search(q="python")
+
+        for request in httpx_mock.get_requests():
+            assert "If-None-Match" not in request.headers
+
+
+class TestFeedResponseCache:
+    def test_304_returns_cached_object(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json=_FEED_PAGE, headers={"ETag": '"f1"'})
+        httpx_mock.add_response(status_code=304)
+
+        with JoboClient(api_key="test-key", base_url=BASE_URL, cache_responses=True) as client:
+            first = client.feed.get_jobs(batch_size=10)
+            second = client.feed.get_jobs(batch_size=10)
+
+        assert second is first
+        requests = httpx_mock.get_requests()
+        assert requests[1].headers["If-None-Match"] == '"f1"'
+
+    def test_different_bodies_use_different_entries(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json=_FEED_PAGE, headers={"ETag": '"f1"'})
+        httpx_mock.add_response(json=_FEED_PAGE, headers={"ETag": '"f2"'})
+
+        with JoboClient(api_key="test-key", base_url=BASE_URL, cache_responses=True) as client:
+            client.feed.get_jobs(batch_size=10)
+            client.feed.get_jobs(batch_size=20)
+
+        for request in httpx_mock.get_requests():
+            assert "If-None-Match" not in request.headers
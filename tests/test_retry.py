@@ -0,0 +1,113 @@
+"""Offline tests for the retrying transports, mocked with pytest-httpx.
+
+No API key required: pytest-httpx intercepts at the httpx transport
+layer, underneath :class:`RetryTransport`, so the retry loop itself runs
+for real.
+"""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from jobo_enterprise._transport import RetryTransport, _backoff
+from jobo_enterprise.client import AsyncJoboClient, JoboClient
+from jobo_enterprise.exceptions import JoboServerError, JoboValidationError
+
+BASE_URL = "https://retry.example.test"
+
+
+class TestBackoff:
+    def test_exponential_with_cap(self):
+        assert _backoff(0, None) == 0.5
+        assert _backoff(1, None) == 1.0
+        assert _backoff(2, None) == 2.0
+        assert _backoff(10, None) == 8.0
+
+    def test_retry_after_takes_precedence(self):
+        assert _backoff(0, "3") == 3.0
+
+    def test_huge_retry_after_is_clamped(self):
+        assert _backoff(0, "3600") == 60.0
+
+    def test_unparseable_retry_after_falls_back(self):
+        assert _backoff(0, "soon") == 0.5
+
+    def test_negative_retry_after_clamps_to_zero(self):
+        assert _backoff(0, "-5") == 0.0
+
+
+class TestSyncRetry:
+    def test_retries_until_success(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(status_code=503, headers={"Retry-After": "0"})
+        httpx_mock.add_response(status_code=429, headers={"Retry-After": "0"})
+        httpx_mock.add_response(status_code=200, json={"jobs": [], "has_more": False})
+
+        with JoboClient(api_key="test-key", base_url=BASE_URL) as client:
+            response = client.feed.get_jobs()
+
+        assert response.jobs == []
+        assert len(httpx_mock.get_requests()) == 3
+
+    def test_gives_up_after_max_retries(self, httpx_mock: HTTPXMock):
+        for _ in range(4):
+            httpx_mock.add_response(status_code=500, headers={"Retry-After": "0"})
+
+        with JoboClient(api_key="test-key", base_url=BASE_URL) as client:
+            with pytest.raises(JoboServerError):
+                client.feed.get_jobs()
+
+        # Initial request plus the client default of 3 retries.
+        assert len(httpx_mock.get_requests()) == 4
+
+    def test_non_retryable_status_is_not_retried(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(status_code=400, json={"detail": "bad request"})
+
+        with JoboClient(api_key="test-key", base_url=BASE_URL) as client:
+            with pytest.raises(JoboValidationError):
+                client.feed.get_jobs()
+
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_discarded_responses_are_closed(self):
+        responses = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            response = httpx.Response(503 if not responses else 200, headers={"Retry-After": "0"})
+            responses.append(response)
+            return response
+
+        transport = RetryTransport(httpx.MockTransport(handler), max_retries=1)
+        final = transport.handle_request(httpx.Request("GET", BASE_URL))
+
+        assert final.status_code == 200
+        assert responses[0].is_closed
+
+
+class TestAsyncRetry:
+    async def test_retries_until_success(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(status_code=503, headers={"Retry-After": "0"})
+        httpx_mock.add_response(status_code=200, json={"jobs": [], "has_more": False})
+
+        client = AsyncJoboClient(api_key="test-key", base_url=BASE_URL)
+        try:
+            response = await client.feed.get_jobs()
+        finally:
+            await client.close()
+
+        assert response.jobs == []
+        assert len(httpx_mock.get_requests()) == 2
+
+    async def test_gives_up_after_max_retries(self, httpx_mock: HTTPXMock):
+        for _ in range(4):
+            httpx_mock.add_response(status_code=500, headers={"Retry-After": "0"})
+
+        client = AsyncJoboClient(api_key="test-key", base_url=BASE_URL)
+        try:
+            with pytest.raises(JoboServerError):
+                await client.feed.get_jobs()
+        finally:
+            await client.close()
+
+        assert len(httpx_mock.get_requests()) == 4